@@ -4,7 +4,6 @@ from lamin_utils import logger
 
 from .core._settings import settings
 from .core._settings_store import current_instance_settings_file
-from .core._setup_bionty_sources import delete_bionty_sources_yaml
 from .core.cloud_sqlite_locker import clear_locker
 
 
@@ -25,6 +24,8 @@ def close(mute: bool = False) -> None:
             else:
                 raise e
         if "bionty" in settings.instance.modules:
+            from .core._setup_bionty_sources import delete_bionty_sources_yaml
+
             delete_bionty_sources_yaml()
         current_instance_settings_file().unlink()
         clear_locker()
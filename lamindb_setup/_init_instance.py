@@ -3,6 +3,7 @@ from __future__ import annotations
 import importlib
 import os
 import uuid
+from functools import cache
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
@@ -25,7 +26,10 @@ if TYPE_CHECKING:
     from .core.types import UPathStr
 
 
-def get_schema_module_name(module_name, raise_import_error: bool = True) -> str | None:
+# raises if the module isn't installed, exceptions aren't cached
+# so a module installed later in the same session is still found
+@cache
+def _find_schema_module_name(module_name: str) -> str:
     import importlib.util
 
     if module_name == "core":
@@ -35,11 +39,19 @@ def get_schema_module_name(module_name, raise_import_error: bool = True) -> str
         module_spec = importlib.util.find_spec(name)
         if module_spec is not None:
             return name
-    message = f"schema module '{module_name}' is not installed → no access to its labels & registries (resolve via `pip install {module_name}`)"
-    if raise_import_error:
-        raise ImportError(message)
-    logger.warning(message.lower())
-    return None
+    raise ImportError(
+        f"schema module '{module_name}' is not installed → no access to its labels & registries (resolve via `pip install {module_name}`)"
+    )
+
+
+def get_schema_module_name(module_name, raise_import_error: bool = True) -> str | None:
+    try:
+        return _find_schema_module_name(module_name)
+    except ImportError as error:
+        if raise_import_error:
+            raise error
+        logger.warning(str(error).lower())
+        return None
 
 
 def register_storage_in_instance(ssettings: StorageSettings):
@@ -288,7 +300,9 @@ def init(
                 isettings, account_id=user__uuid, access_token=access_token
             )
         validate_sqlite_state(isettings)
-        # why call it here if it is also called in load_from_isettings?
+        # persist before setting up the database because lamindb checks the
+        # current instance settings file on import
+        # load_from_isettings(init=True) below doesn't write them again
         isettings._persist(write_to_disk=_write_settings)
         if _test:
             return None
@@ -359,7 +373,8 @@ def load_from_isettings(
         # yet be registered
         if not isettings._get_settings_file().exists():
             register_user(user)
-    isettings._persist(write_to_disk=write_settings)
+    # upon init, the settings were already written to disk before setting up the db
+    isettings._persist(write_to_disk=write_settings and not init)
 
 
 def validate_sqlite_state(isettings: InstanceSettings) -> None:
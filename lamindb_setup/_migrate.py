@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from django.db import connection
-from django.db.migrations.loader import MigrationLoader
+from functools import lru_cache
+
 from lamin_utils import logger
 from packaging import version
 
@@ -10,14 +10,22 @@ from .core._settings import settings
 from .core.django import setup_django
 
 
-# for the django-based synching code, see laminhub_rest
-def check_whether_migrations_in_sync(db_version_str: str):
+@lru_cache(maxsize=1)
+def _installed_lamindb_version() -> str | None:
+    # scanning the installed distributions is slow & yields the same within a session
     from importlib import metadata
 
     try:
-        installed_version_str = metadata.version("lamindb")
+        return metadata.version("lamindb")
     except metadata.PackageNotFoundError:
         return None
+
+
+# for the django-based synching code, see laminhub_rest
+def check_whether_migrations_in_sync(db_version_str: str):
+    installed_version_str = _installed_lamindb_version()
+    if installed_version_str is None:
+        return None
     if db_version_str is None:
         logger.warning("no lamindb version stored to compare with installed version")
         return None
@@ -195,6 +203,8 @@ class migrate:
     @classmethod
     def deployed_migrations(cls, latest: bool = False):
         """Get the list of deployed migrations from Migration table in DB."""
+        from django.db import connection
+
         if latest:
             latest_migrations = {}
             with connection.cursor() as cursor:
@@ -217,6 +227,8 @@ class migrate:
 
             return latest_migrations
         else:
+            from django.db.migrations.loader import MigrationLoader
+
             # Load all migrations using Django's migration loader
             loader = MigrationLoader(connection)
             squashed_replacements = set()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from urllib.request import urlretrieve
 
 from gotrue.errors import AuthUnknownError
@@ -18,6 +19,8 @@ class Connector(BaseSettings):
     key: str
 
 
+# downloads the connector file, hence, only do it once per session
+@lru_cache(maxsize=1)
 def load_fallback_connector() -> Connector:
     url = "https://lamin-site-assets.s3.amazonaws.com/connector.env"
     connector_file, _ = urlretrieve(url)
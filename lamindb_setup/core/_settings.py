@@ -139,12 +139,14 @@ class SetupSettings:
 
     @property
     def _instance_exists(self):
-        try:
-            self.instance  # noqa
+        # mirrors the checks of self.instance without loading the settings file
+        env_changed = (
+            self._instance_settings_env is not None
+            and self._instance_settings_env != get_env_name()
+        )
+        if self._instance_settings is not None and not env_changed:
             return True
-        # this is implicit logic that catches if no instance is loaded
-        except SystemExit:
-            return False
+        return current_instance_settings_file().exists()
 
     @property
     def cache_dir(self) -> UPath:
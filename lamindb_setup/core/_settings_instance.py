@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
@@ -12,12 +13,14 @@ from ._deprecated import deprecated
 from ._hub_client import call_with_fallback
 from ._hub_crud import select_account_handle_name_by_lnid
 from ._hub_utils import LaminDsn, LaminDsnModel
-from ._settings_save import save_instance_settings
+from ._settings_save import serialize_instance_settings, write_settings_file
 from ._settings_storage import StorageSettings, init_storage, mark_storage_root
 from ._settings_store import current_instance_settings_file, instance_settings_file
 from .cloud_sqlite_locker import (
     EXPIRATION_TIME,
     InstanceLockedException,
+    empty_locker,
+    get_locker,
 )
 from .upath import LocalPathClasses, UPath
 
@@ -27,6 +30,7 @@ if TYPE_CHECKING:
     from ._settings_user import UserSettings
 
 
+@lru_cache(maxsize=128)
 def sanitize_git_repo_url(repo_url: str) -> str:
     assert repo_url.startswith("https://")
     return repo_url.replace(".git", "")
@@ -45,6 +49,29 @@ def is_local_db_url(db_url: str) -> bool:
 class InstanceSettings:
     """Instance settings."""
 
+    __slots__ = (
+        "_id_",
+        "_sqlite_key",
+        "_owner",
+        "_name",
+        "_uid",
+        "_storage",
+        "_db",
+        "_dialect",
+        "_is_cloud_sqlite_",
+        "_db_parsed",
+        "_schema_str",
+        "_modules",
+        "_git_repo",
+        "_keep_artifacts_local",
+        "_storage_local",
+        "_storage_local_searched",
+        "_is_on_hub",
+        "_api_url",
+        "_schema_id",
+        "_locker_user",
+    )
+
     def __init__(
         self,
         id: UUID,  # instance id/uuid
@@ -64,17 +91,34 @@ class InstanceSettings:
         from ._hub_utils import validate_db_arg
 
         self._id_: UUID = id
+        # storage key of the sqlite file
+        self._sqlite_key: str = f"{id.hex}.lndb"
         self._owner: str = owner
         self._name: str = name
         self._uid: str | None = uid
         self._storage: StorageSettings = storage
         validate_db_arg(db)
         self._db: str | None = db
+        if db is None or db.startswith("sqlite://"):
+            self._dialect: Literal["sqlite", "postgresql"] = "sqlite"
+        else:
+            assert db.startswith("postgresql"), f"Unexpected DB value: {db}"
+            self._dialect = "postgresql"
+        # computed upon first access because it needs the storage type
+        self._is_cloud_sqlite_: bool | None = None
+        # parsed postgres db URI, only needed for __repr__
+        self._db_parsed: LaminDsnModel | None = None
         self._schema_str: str | None = modules
+        # parse once, modules is queried on many code paths
+        self._modules: frozenset[str] = frozenset(
+            module for module in (modules or "").split(",") if module != ""
+        )
         self._git_repo = None if git_repo is None else sanitize_git_repo_url(git_repo)
         # local storage
         self._keep_artifacts_local = keep_artifacts_local
         self._storage_local: StorageSettings | None = None
+        # whether _search_local_root() could query the registry for the default root
+        self._storage_local_searched: bool = False
         self._is_on_hub = is_on_hub
         # private, needed for writing instance settings
         self._api_url = api_url
@@ -93,7 +137,9 @@ class InstanceSettings:
                 representation += f"\n- storage region: {value.region}"
             elif attr == "db":
                 if self.dialect != "sqlite":
-                    model = LaminDsnModel(db=value)
+                    if self._db_parsed is None:
+                        self._db_parsed = LaminDsnModel(db=value)
+                    model = self._db_parsed
                     db_print = LaminDsn.build(
                         scheme=model.db.scheme,
                         user=model.db.user,
@@ -129,17 +175,28 @@ class InstanceSettings:
         else:
             # only search local managed storage locations (instance_uid=self.uid)
             local_records = Storage.objects.filter(type="local", instance_uid=self.uid)
-        all_local_records = local_records.all()
         try:
-            # trigger an error in case of a migration issue
-            all_local_records.first()
+            # evaluate once, triggers an error in case of a migration issue
+            all_local_records = list(local_records)
         except ProgrammingError:
+            # not memoized, the search succeeds once the instance is migrated
             logger.error("not able to load Storage registry: please migrate")
             return None
+        if local_root is None:
+            # the registry could be queried, storage_local needn't search again
+            self._storage_local_searched = True
+        # check the roots concurrently because they might be on network mounts
+        root_paths = [Path(record.root) for record in all_local_records]
+        if len(root_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(root_paths))) as executor:
+                roots_exist = list(executor.map(Path.exists, root_paths))
+        else:
+            roots_exist = [root_path.exists() for root_path in root_paths]
         found = False
-        for record in all_local_records:
-            root_path = Path(record.root)
-            if root_path.exists():
+        for record, root_path, root_exists in zip(
+            all_local_records, root_paths, roots_exist
+        ):
+            if root_exists:
                 marker_path = root_path / ".lamindb/_is_initialized"
                 if marker_path.exists():
                     try:
@@ -207,11 +264,14 @@ class InstanceSettings:
         """
         if not self._keep_artifacts_local:
             raise ValueError("`keep_artifacts_local` is not enabled for this instance.")
-        if self._storage_local is None:
+        if self._storage_local is None and not self._storage_local_searched:
+            # only query the Storage registry upon first access
             self._storage_local = self._search_local_root()
         if self._storage_local is None:
-            # raise an error, there was a warning just before in search_local_root
-            raise ValueError()
+            # there was a warning upon the first search in search_local_root
+            raise ValueError(
+                "none of the registered local storage locations were found in your environment"
+            )
         return self._storage_local
 
     @storage_local.setter
@@ -236,9 +296,11 @@ class InstanceSettings:
             else:
                 response = input(
                     "You already configured a local storage root for this instance in this"
-                    f" environment: {self.storage_local.root}\nDo you want to register another one? (y/n)"
+                    f" environment: {storage_local.root}\nDo you want to register another one? (y/n)"
                 )
             if response != "y":
+                # keep defaulting to the configured local storage root
+                self._storage_local = storage_local
                 return None
         local_root = UPath(local_root)
         assert isinstance(local_root, LocalPathClasses)
@@ -279,8 +341,8 @@ class InstanceSettings:
         """
         if self._schema_str is None:
             return {}  # type: ignore
-        else:
-            return {module for module in self._schema_str.split(",") if module != ""}
+        # a copy of the parsed modules, callers may mutate the returned set
+        return set(self._modules)
 
     @property
     @deprecated("modules")
@@ -290,7 +352,8 @@ class InstanceSettings:
     @property
     def _sqlite_file(self) -> UPath:
         """SQLite file."""
-        return self.storage.key_to_filepath(f"{self._id.hex}.lndb")
+        # not cached because the root of cloud storage refreshes credentials
+        return self.storage.key_to_filepath(self._sqlite_key)
 
     @property
     def _sqlite_file_local(self) -> Path:
@@ -301,17 +364,25 @@ class InstanceSettings:
         """Upload the local sqlite file to the cloud file."""
         if self._is_cloud_sqlite:
             sqlite_file = self._sqlite_file
-            logger.warning(
-                f"updating{' & unlocking' if unlock_cloud_sqlite else ''} cloud SQLite "
-                f"'{sqlite_file}' of instance"
-                f" '{self.slug}'"
-            )
             cache_file = self.storage.cloud_to_local_no_update(sqlite_file)
-            sqlite_file.upload_from(cache_file, print_progress=True)  # type: ignore
-            cloud_mtime = sqlite_file.modified.timestamp()  # type: ignore
-            # this seems to work even if there is an open connection
-            # to the cache file
-            os.utime(cache_file, times=(cloud_mtime, cloud_mtime))
+            try:
+                cloud_mtime = sqlite_file.modified.timestamp()  # type: ignore
+            except FileNotFoundError:
+                # the cloud file doesn't exist yet upon init
+                cloud_mtime = None
+            # the mtime of the cache file is set to the one of the cloud file
+            # upon download & upload, it only differs if the cache file was written
+            if cloud_mtime is None or cache_file.stat().st_mtime != cloud_mtime:
+                logger.warning(
+                    f"updating{' & unlocking' if unlock_cloud_sqlite else ''} cloud SQLite "
+                    f"'{sqlite_file}' of instance"
+                    f" '{self.slug}'"
+                )
+                sqlite_file.upload_from(cache_file, print_progress=True)  # type: ignore
+                cloud_mtime = sqlite_file.modified.timestamp()  # type: ignore
+                # this seems to work even if there is an open connection
+                # to the cache file
+                os.utime(cache_file, times=(cloud_mtime, cloud_mtime))
             if unlock_cloud_sqlite:
                 self._cloud_sqlite_locker.unlock()
 
@@ -374,24 +445,22 @@ class InstanceSettings:
     @property
     def dialect(self) -> Literal["sqlite", "postgresql"]:
         """SQL dialect."""
-        if self._db is None or self._db.startswith("sqlite://"):
-            return "sqlite"
-        else:
-            assert self._db.startswith("postgresql"), f"Unexpected DB value: {self._db}"
-            return "postgresql"
+        return self._dialect
 
     @property
     def _is_cloud_sqlite(self) -> bool:
         # can we make this a private property, Sergei?
         # as it's not relevant to the user
         """Is this a cloud instance with sqlite db."""
-        return self.dialect == "sqlite" and self.storage.type_is_cloud
+        # the storage of a sqlite instance can't be switched, see set_managed_storage
+        if self._is_cloud_sqlite_ is None:
+            self._is_cloud_sqlite_ = (
+                self._dialect == "sqlite" and self.storage.type_is_cloud
+            )
+        return self._is_cloud_sqlite_
 
     @property
     def _cloud_sqlite_locker(self):
-        # avoid circular import
-        from .cloud_sqlite_locker import empty_locker, get_locker
-
         if self._is_cloud_sqlite:
             try:
                 # if _locker_user is None then settings.user is used
@@ -408,8 +477,10 @@ class InstanceSettings:
         if not self.storage.type_is_cloud:
             return False
 
-        if self.dialect == "postgresql":
-            if is_local_db_url(self.db):
+        # use the raw db string, the db property logs a warning if
+        # LAMINDB_DJANGO_DATABASE_URL is set
+        if self._dialect == "postgresql":
+            if is_local_db_url(self._db):  # type: ignore
                 return False
         # returns True for cloud SQLite
         # and remote postgres
@@ -455,10 +526,11 @@ class InstanceSettings:
         if write_to_disk:
             assert self.name is not None
             filepath = self._get_settings_file()
+            content = serialize_instance_settings(self)
             # persist under filepath for later reference
-            save_instance_settings(self, filepath)
+            write_settings_file(filepath, content)
             # persist under current file for auto load
-            shutil.copy2(filepath, current_instance_settings_file())
+            write_settings_file(current_instance_settings_file(), content)
             # persist under settings class for same session reference
             # need to import here to avoid circular import
         from ._settings import settings
@@ -486,14 +558,14 @@ class InstanceSettings:
 
         # Is the database available and initialized as LaminDB?
         # returns a tuple of status code and message
-        if self.dialect == "sqlite" and not self._sqlite_file.exists():
+        if self.dialect == "sqlite" and not (sqlite_file := self._sqlite_file).exists():
             legacy_file = self.storage.key_to_filepath(f"{self.name}.lndb")
             if legacy_file.exists():
                 raise RuntimeError(
                     "The SQLite file has been renamed!\nPlease rename your SQLite file"
-                    f" {legacy_file} to {self._sqlite_file}"
+                    f" {legacy_file} to {sqlite_file}"
                 )
-            return False, f"SQLite file {self._sqlite_file} does not exist"
+            return False, f"SQLite file {sqlite_file} does not exist"
 
         from .django import setup_django
 
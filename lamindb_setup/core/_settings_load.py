@@ -12,9 +12,11 @@ from ._settings_storage import StorageSettings
 from ._settings_store import (
     InstanceSettingsStore,
     UserSettingsStore,
+    _user_settings_store_cache,
     current_instance_settings_file,
     current_user_settings_file,
     system_storage_settings_file,
+    user_settings_store_state,
 )
 from ._settings_user import UserSettings
 
@@ -70,15 +72,22 @@ def load_or_create_user_settings() -> UserSettings:
 
 
 def load_user_settings(user_settings_file: Path):
-    try:
-        settings_store = UserSettingsStore(_env_file=user_settings_file)
-    except (ValidationError, TypeError) as error:
-        msg = (
-            "Your user settings file is invalid, please delete"
-            f" {user_settings_file} and log in again."
-        )
-        print(msg)
-        raise SettingsEnvFileOutdated(msg) from error
+    store_state = user_settings_store_state(user_settings_file)
+    cached = _user_settings_store_cache.get(user_settings_file)
+    if cached is not None and cached[0] == store_state:
+        settings_store = cached[1]
+    else:
+        try:
+            settings_store = UserSettingsStore(_env_file=user_settings_file)
+        except (ValidationError, TypeError) as error:
+            msg = (
+                "Your user settings file is invalid, please delete"
+                f" {user_settings_file} and log in again."
+            )
+            print(msg)
+            raise SettingsEnvFileOutdated(msg) from error
+        _user_settings_store_cache[user_settings_file] = (store_state, settings_store)
+    # always create new settings from the store, callers mutate them
     settings = setup_user_from_store(settings_store)
     return settings
 
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, get_type_hints
 from uuid import UUID
@@ -7,6 +11,7 @@ from uuid import UUID
 from ._settings_store import (
     InstanceSettingsStore,
     UserSettingsStore,
+    clear_user_settings_store_cache,
     current_user_settings_file,
     system_storage_settings_file,
     user_settings_file_email,
@@ -14,22 +19,102 @@ from ._settings_store import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ._settings_user import UserSettings
     from .types import UPathStr
 
 
+# the umask can only be read by setting it, hence, read it once on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def attrgetter_or_none(key: str) -> Callable[[Any], Any]:
+    # settings objects lacking an attribute serialize it as null
+    def getter(settings: Any) -> Any:
+        return getattr(settings, key, None)
+
+    return getter
+
+
+# the store keys & types of the store classes are static, hence, resolve which
+# line prefix, settings attribute & type to use for each of them once on import
+def settings_fields(
+    type_hints: dict[str, Any], prefix: str
+) -> tuple[tuple[str, Any, Any], ...]:
+    fields = []
+    for store_key, type_ in type_hints.items():
+        if "__" in store_key or store_key == "model_config":
+            continue
+        if type_ == Optional[str]:
+            type_ = str
+        if type_ == Optional[bool]:
+            type_ = bool
+        getter: Callable[[Any], Any]
+        if store_key == "storage_root":
+            getter = attrgetter("storage.root_as_str")
+        elif store_key == "storage_region":
+            getter = attrgetter("storage.region")
+        else:
+            if store_key in {
+                "db",
+                "schema_str",
+                "name_",
+                "uuid",
+                "id",
+                "api_url",
+                "schema_id",
+            }:
+                settings_key = f"_{store_key.rstrip('_')}"
+            else:
+                settings_key = store_key
+            getter = attrgetter_or_none(settings_key)
+        fields.append((f"{prefix}{store_key}=", getter, type_))
+    return tuple(fields)
+
+
+USER_SETTINGS_FIELDS = settings_fields(get_type_hints(UserSettingsStore), "lamin_user_")
+INSTANCE_SETTINGS_FIELDS = settings_fields(
+    get_type_hints(InstanceSettingsStore), "lamindb_instance_"
+)
+
+
 def save_user_settings(settings: UserSettings):
-    type_hints = get_type_hints(UserSettingsStore)
-    prefix = "lamin_user_"
-    save_settings(settings, current_user_settings_file(), type_hints, prefix)
+    content = serialize_settings(settings, USER_SETTINGS_FIELDS)
+    settings_files = [current_user_settings_file()]
     if settings.email is not None:
-        save_settings(
-            settings, user_settings_file_email(settings.email), type_hints, prefix
-        )
+        settings_files.append(user_settings_file_email(settings.email))
     if settings.handle is not None and settings.handle != "anonymous":
-        save_settings(
-            settings, user_settings_file_handle(settings.handle), type_hints, prefix
-        )
+        settings_files.append(user_settings_file_handle(settings.handle))
+    for settings_file in settings_files:
+        write_settings_file(settings_file, content)
+
+
+def write_settings_file(settings_file: Path, content: str):
+    # write to a temporary file first so that an interrupted write can't leave
+    # a truncated settings file behind, replace() is atomic
+    # the temporary file has a unique name so that concurrent writers of the
+    # same settings file (e.g., two logins) don't move each other's file away
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f"{settings_file.name}.", suffix=".tmp", dir=settings_file.parent
+    )
+    tmp_file = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        # mkstemp creates the file readable only by the owner, keep the
+        # permissions of an existing settings file & give a new one the
+        # permissions that open() would give it
+        if settings_file.exists():
+            shutil.copymode(settings_file, tmp_file)
+        else:
+            tmp_file.chmod(0o666 & ~_UMASK)
+        tmp_file.replace(settings_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    clear_user_settings_store_cache(settings_file)
 
 
 def save_settings(
@@ -38,46 +123,31 @@ def save_settings(
     type_hints: dict[str, Any],
     prefix: str,
 ):
-    with open(settings_file, "w") as f:
-        for store_key, type_ in type_hints.items():
-            if type_ == Optional[str]:
-                type_ = str
-            if type_ == Optional[bool]:
-                type_ = bool
-            if "__" not in store_key:
-                if store_key == "model_config":
-                    continue
-                if store_key == "storage_root":
-                    value = settings.storage.root_as_str
-                elif store_key == "storage_region":
-                    value = settings.storage.region
-                else:
-                    if store_key in {
-                        "db",
-                        "schema_str",
-                        "name_",
-                        "uuid",
-                        "id",
-                        "api_url",
-                        "schema_id",
-                    }:
-                        settings_key = f"_{store_key.rstrip('_')}"
-                    else:
-                        settings_key = store_key
-                    value = getattr(settings, settings_key, None)
-                if value is None:
-                    value = "null"
-                elif isinstance(value, UUID):
-                    value = value.hex
-                else:
-                    value = type_(value)
-                f.write(f"{prefix}{store_key}={value}\n")
+    content = serialize_settings(settings, settings_fields(type_hints, prefix))
+    write_settings_file(settings_file, content)
+
+
+def serialize_value(value: Any, type_: Any) -> str:
+    if value is None:
+        return "null"
+    elif isinstance(value, UUID):
+        return value.hex
+    return type_(value)
+
+
+def serialize_settings(settings: Any, fields: tuple[tuple[str, Any, Any], ...]) -> str:
+    return "".join(
+        f"{line_prefix}{serialize_value(getter(settings), type_)}\n"
+        for line_prefix, getter, type_ in fields
+    )
 
 
 def save_instance_settings(settings: Any, settings_file: Path):
-    type_hints = get_type_hints(InstanceSettingsStore)
-    prefix = "lamindb_instance_"
-    save_settings(settings, settings_file, type_hints, prefix)
+    write_settings_file(settings_file, serialize_instance_settings(settings))
+
+
+def serialize_instance_settings(settings: Any) -> str:
+    return serialize_settings(settings, INSTANCE_SETTINGS_FIELDS)
 
 
 def save_system_storage_settings(
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -22,26 +23,33 @@ def get_settings_file_name_prefix():
     return ""
 
 
+# the settings file paths are keyed on the LAMIN_ENV prefix, which is read
+# upon every call, hence, switching LAMIN_ENV also switches the paths
+@lru_cache(maxsize=256)
+def _settings_file(prefix: str, file_name: str) -> Path:
+    return settings_dir / f"{prefix}{file_name}"
+
+
 def current_instance_settings_file():
-    return settings_dir / f"{get_settings_file_name_prefix()}current_instance.env"
+    return _settings_file(get_settings_file_name_prefix(), "current_instance.env")
 
 
 def current_user_settings_file():
-    return settings_dir / f"{get_settings_file_name_prefix()}current_user.env"
+    return _settings_file(get_settings_file_name_prefix(), "current_user.env")
 
 
 def instance_settings_file(name: str, owner: str):
-    return (
-        settings_dir / f"{get_settings_file_name_prefix()}instance--{owner}--{name}.env"
+    return _settings_file(
+        get_settings_file_name_prefix(), f"instance--{owner}--{name}.env"
     )
 
 
 def user_settings_file_email(email: str):
-    return settings_dir / f"{get_settings_file_name_prefix()}user--{email}.env"
+    return _settings_file(get_settings_file_name_prefix(), f"user--{email}.env")
 
 
 def user_settings_file_handle(handle: str):
-    return settings_dir / f"{get_settings_file_name_prefix()}user--{handle}.env"
+    return _settings_file(get_settings_file_name_prefix(), f"user--{handle}.env")
 
 
 def system_storage_settings_file():
@@ -73,3 +81,28 @@ class UserSettingsStore(BaseSettings):
     handle: str
     name: str
     model_config = SettingsConfigDict(env_prefix="lamin_user_", env_file=".env")
+
+
+# parsed user settings files keyed by path, a cached store is only used while
+# (st_mtime_ns, st_size) of the file & the lamin_user_ env variables, which
+# pydantic-settings reads on top of the file, match, writers also drop the entry
+_user_settings_store_cache: dict[Path, tuple[tuple, UserSettingsStore]] = {}
+
+
+def user_settings_store_state(settings_file: Path) -> tuple:
+    stat = settings_file.stat()
+    env_vars = tuple(
+        sorted(
+            (key.lower(), value)
+            for key, value in os.environ.items()
+            if key.lower().startswith("lamin_user_")
+        )
+    )
+    return stat.st_mtime_ns, stat.st_size, env_vars
+
+
+def clear_user_settings_store_cache(settings_file: Optional[Path] = None) -> None:
+    if settings_file is None:
+        _user_settings_store_cache.clear()
+    else:
+        _user_settings_store_cache.pop(settings_file, None)
@@ -30,6 +30,13 @@ def setup_django(
     init: bool = False,
     view_schema: bool = False,
 ):
+    global IS_SETUP
+
+    # django is configured & set up already, e.g., migrate.deploy() followed by
+    # migrate.check(), there is nothing to do unless migrations are managed
+    if IS_SETUP and not (deploy_migrations or create_migrations or init):
+        return None
+
     if IS_RUN_FROM_IPYTHON:
         os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
 
@@ -119,8 +126,4 @@ def setup_django(
         )  # may change back to verbosity 0 in the future
         IS_MIGRATING = False
 
-    global IS_SETUP
     IS_SETUP = True
-
-    if isettings.keep_artifacts_local:
-        isettings._search_local_root()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 
 import nox
 from laminci.nox import (
@@ -14,6 +15,17 @@ from laminci.nox import (
 nox.options.default_venv_backend = "none"
 
 COVERAGE_ARGS = "--cov=lamindb_setup --cov-append --cov-report=term-missing"
+# distribute test modules across workers, the tests of a module run in the same
+# worker; only for groups whose modules don't share the current instance
+PYTEST_PARALLEL_ARGS = "-n auto --dist loadfile"
+
+
+def _cov_env(env: dict | None = None) -> dict:
+    # coverage's sys.monitoring core (PEP 669) is much faster than settrace
+    env = {} if env is None else dict(env)
+    if sys.version_info >= (3, 12):
+        env["COVERAGE_CORE"] = "sysmon"
+    return env
 
 
 @nox.session
@@ -28,25 +40,30 @@ def lint(session: nox.Session) -> None:
 )
 def install(session: nox.Session, group: str) -> None:
     no_deps_packages = "git+https://github.com/laminlabs/lamindb git+https://github.com/laminlabs/wetlab git+https://github.com/laminlabs/lamin-cli"
-    modules_deps = f"""uv pip install --system git+https://github.com/laminlabs/bionty
+
+    # pass independent packages to a single uv call, uv resolves once and
+    # fetches them concurrently, separate calls run one after another
+    def modules_deps(extra_packages: str = "") -> str:
+        bionty_deps = f"git+https://github.com/laminlabs/bionty {extra_packages}"
+        return f"""uv pip install --system {bionty_deps.strip()}
 uv pip install --system --no-deps {no_deps_packages}
 """
+
     if group == "hub-cloud":
         cmds = (
-            modules_deps + "uv pip install --system ./laminhub/rest-hub line_profiler"
+            modules_deps() + "uv pip install --system ./laminhub/rest-hub line_profiler"
         )
     elif group == "docs":
         cmds = """uv pip install --system git+https://github.com/laminlabs/lamindb"""
     elif group == "storage":
-        cmds = modules_deps + "uv pip install --system gcsfs huggingface_hub"
+        cmds = modules_deps("gcsfs huggingface_hub").strip()
     elif group == "hub-prod":
         # cmds = "git clone --depth 1 https://github.com/django/django\n"
         # cmds += "uv pip install --system -e ./django\n"
         cmds = ""
-        cmds += modules_deps.strip()
-        cmds += """\nuv pip install --system huggingface_hub"""
+        cmds += modules_deps("huggingface_hub").strip()
     elif group == "hub-local":
-        cmds = modules_deps.strip()
+        cmds = modules_deps().strip()
     # current package
     cmds += """\nuv pip install --system -e '.[aws,dev]'"""
 
@@ -70,12 +87,13 @@ def build(session: nox.Session, group: str, lamin_env: str):
     env = {"LAMIN_ENV": lamin_env, "LAMIN_TESTING": "true"}
     login_testuser1(session, env=env)
     login_testuser2(session, env=env)
+    cov_env = _cov_env(env)
     if group == "hub-prod":
-        run(session, f"pytest {COVERAGE_ARGS} ./tests/hub-prod", env=env)
-        run(session, f"pytest -s {COVERAGE_ARGS} ./docs/hub-prod", env=env)
+        run(session, f"pytest {COVERAGE_ARGS} ./tests/hub-prod", env=cov_env)
+        run(session, f"pytest -s {COVERAGE_ARGS} ./docs/hub-prod", env=cov_env)
     elif group == "hub-cloud":
-        run(session, f"pytest {COVERAGE_ARGS} ./tests/hub-cloud", env=env)
-        run(session, f"pytest -s {COVERAGE_ARGS} ./docs/hub-cloud", env=env)
+        run(session, f"pytest {COVERAGE_ARGS} ./tests/hub-cloud", env=cov_env)
+        run(session, f"pytest -s {COVERAGE_ARGS} ./docs/hub-cloud", env=cov_env)
 
 
 @nox.session
@@ -85,7 +103,7 @@ def hub_local(session: nox.Session):
     run(
         session,
         f"pytest -n 1 {COVERAGE_ARGS} ./tests/hub-local",
-        env=os.environ,
+        env=_cov_env(os.environ),
     )
 
 
@@ -99,7 +117,13 @@ def storage(session: nox.Session):
     # mimic anonymous access
     del os.environ["AWS_ACCESS_KEY_ID"]
     del os.environ["AWS_SECRET_ACCESS_KEY"]
-    run(session, f"pytest {COVERAGE_ARGS} ./tests/storage", env=os.environ)
+    # only test_storage_access.py connects to an instance, all other modules
+    # are independent of the current instance
+    run(
+        session,
+        f"pytest {PYTEST_PARALLEL_ARGS} {COVERAGE_ARGS} ./tests/storage",
+        env=_cov_env(os.environ),
+    )
 
 
 @nox.session
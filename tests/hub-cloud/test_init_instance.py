@@ -108,28 +108,25 @@ def test_init_instance_cloud_aws_us():
     # run for the second time
     # just loads an already existing instance
     ln_setup.init(storage=storage, _test=True)
+    isettings = ln_setup.settings.instance
+    ssettings = isettings.storage
     hub = connect_hub_with_auth()
-    account = select_account_by_handle(
-        handle=ln_setup.settings.instance.owner, client=hub
-    )
+    account = select_account_by_handle(handle=isettings.owner, client=hub)
     instance = select_instance_by_name(
         account_id=account["id"],
-        name=ln_setup.settings.instance.name,
+        name=isettings.name,
         client=hub,
     )
     # test default storage record is correct
     storage_record = select_default_storage_by_instance_id(instance["id"], hub)
     assert storage_record["root"] == storage
     # test instance settings
-    assert ln_setup.settings.instance._id == UUID(instance["id"])
-    assert ln_setup.settings.storage.type_is_cloud
-    assert str(ln_setup.settings.storage.root) == storage
-    assert ln_setup.settings.storage.root_as_str == storage
-    assert ln_setup.settings.storage.region == "us-west-1"
-    assert (
-        str(ln_setup.settings.instance._sqlite_file)
-        == f"{storage}/{ln_setup.settings.instance._id.hex}.lndb"
-    )
+    assert isettings._id == UUID(instance["id"])
+    assert ssettings.type_is_cloud
+    assert str(ssettings.root) == storage
+    assert ssettings.root_as_str == storage
+    assert ssettings.region == "us-west-1"
+    assert str(isettings._sqlite_file) == f"{storage}/{isettings._id.hex}.lndb"
     ln_setup.delete("init_instance_cloud_aws_us", force=True)
 
 
@@ -141,13 +138,11 @@ def test_init_instance_cloud_aws_europe():
         name="lamindb-ci-europe",
         _test=True,
     )
-    assert ln_setup.settings.instance._id is not None
-    assert ln_setup.settings.storage.region == "eu-central-1"
-    assert ln_setup.settings.instance.name == "lamindb-ci-europe"
-    assert (
-        str(ln_setup.settings.instance._sqlite_file)
-        == f"{storage}/{ln_setup.settings.instance._id.hex}.lndb"
-    )
+    isettings = ln_setup.settings.instance
+    assert isettings._id is not None
+    assert isettings.storage.region == "eu-central-1"
+    assert isettings.name == "lamindb-ci-europe"
+    assert str(isettings._sqlite_file) == f"{storage}/{isettings._id.hex}.lndb"
     ln_setup.delete("lamindb-ci-europe", force=True)
 
 
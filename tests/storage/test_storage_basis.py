@@ -2,25 +2,31 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from lamindb_setup.core.upath import extract_suffix_from_path
 
 
-def test_extract_suffix_from_path():
-    # this is a collection of path, stem, suffix tuples
-    collection = [
-        ("a", ""),
-        ("a.txt", ".txt"),
-        ("a.123", ""),  # digits are no valid suffixes
-        ("archive.tar.gz", ".tar.gz"),
-        ("directory/file", ""),
-        ("d.x.y.z/f.b.c", ".c"),
-        ("d.x.y.z/f.a.b.c", ".c"),
-        ("logs/date.log.txt", ".txt"),
-        ("logs/date.log.123", ""),  # digits are no valid suffixes
-        ("salmon.merged.gene_counts.tsv", ".tsv"),
-        ("salmon.merged.gene_counts.tsv.gz", ".tsv.gz"),
-        ("filename.v1.1.0.anndata.zarr", ".anndata.zarr"),
-    ]
-    for path, suffix in collection:
-        filepath = Path(path)
-        assert suffix == extract_suffix_from_path(filepath)
+# this is a collection of path, suffix tuples
+@pytest.mark.parametrize(
+    "path,suffix",
+    [
+        pytest.param("a", "", id="no-suffix"),
+        pytest.param("a.txt", ".txt", id="txt"),
+        # digits are no valid suffixes
+        pytest.param("a.123", "", id="digits"),
+        pytest.param("archive.tar.gz", ".tar.gz", id="tar.gz"),
+        pytest.param("directory/file", "", id="directory-no-suffix"),
+        pytest.param("d.x.y.z/f.b.c", ".c", id="dotted-directory"),
+        pytest.param("d.x.y.z/f.a.b.c", ".c", id="dotted-directory-and-stem"),
+        pytest.param("logs/date.log.txt", ".txt", id="log.txt"),
+        # digits are no valid suffixes
+        pytest.param("logs/date.log.123", "", id="log.digits"),
+        pytest.param("salmon.merged.gene_counts.tsv", ".tsv", id="tsv"),
+        pytest.param("salmon.merged.gene_counts.tsv.gz", ".tsv.gz", id="tsv.gz"),
+        pytest.param(
+            "filename.v1.1.0.anndata.zarr", ".anndata.zarr", id="anndata.zarr"
+        ),
+    ],
+)
+def test_extract_suffix_from_path(path: str, suffix: str):
+    assert suffix == extract_suffix_from_path(Path(path))
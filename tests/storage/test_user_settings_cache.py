@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from lamindb_setup.core import _settings_save
+from lamindb_setup.core._settings_load import load_user_settings
+from lamindb_setup.core._settings_save import save_user_settings
+from lamindb_setup.core._settings_store import (
+    _user_settings_store_cache,
+    clear_user_settings_store_cache,
+)
+from lamindb_setup.core._settings_user import UserSettings
+
+USER_SETTINGS = """\
+lamin_user_email=testuser@lamin.ai
+lamin_user_password=null
+lamin_user_access_token=token
+lamin_user_api_key=null
+lamin_user_uid=abcdefgh
+lamin_user_uuid=null
+lamin_user_handle={handle}
+lamin_user_name=null
+"""
+
+
+@pytest.fixture
+def user_settings_file(tmp_path, monkeypatch):
+    for key in list(os.environ):
+        if key.lower().startswith("lamin_user_"):
+            monkeypatch.delenv(key)
+    settings_file = tmp_path / "current_user.env"
+    settings_file.write_text(USER_SETTINGS.format(handle="testuser"))
+    # save_user_settings() writes the current user settings file
+    monkeypatch.setattr(
+        _settings_save, "current_user_settings_file", lambda: settings_file
+    )
+    yield settings_file
+    clear_user_settings_store_cache(settings_file)
+
+
+def test_cache_hit_on_unchanged_file(user_settings_file):
+    usettings = load_user_settings(user_settings_file)
+    store = _user_settings_store_cache[user_settings_file][1]
+    usettings.handle = "changed"  # callers mutate the returned settings
+    usettings = load_user_settings(user_settings_file)
+    assert _user_settings_store_cache[user_settings_file][1] is store
+    assert usettings.handle == "testuser"
+
+
+def test_invalidation_upon_save(user_settings_file):
+    load_user_settings(user_settings_file)
+    save_user_settings(UserSettings(handle="anonymous", uid="00000000"))
+    assert user_settings_file not in _user_settings_store_cache
+    usettings = load_user_settings(user_settings_file)
+    assert usettings.handle == "anonymous"
+    assert usettings.uid == "00000000"
+
+
+def test_reparse_upon_external_rewrite(user_settings_file):
+    load_user_settings(user_settings_file)
+    store = _user_settings_store_cache[user_settings_file][1]
+    mtime_ns = user_settings_file.stat().st_mtime_ns
+    user_settings_file.write_text(USER_SETTINGS.format(handle="testuser-rewritten"))
+    # ensure a changed stat even on file systems with a coarse mtime resolution
+    os.utime(user_settings_file, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    usettings = load_user_settings(user_settings_file)
+    assert _user_settings_store_cache[user_settings_file][1] is not store
+    assert usettings.handle == "testuser-rewritten"
+
+
+def test_reparse_upon_env_var_change(user_settings_file, monkeypatch):
+    # pydantic-settings reads lamin_user_ env variables on top of the file
+    assert load_user_settings(user_settings_file).handle == "testuser"
+    monkeypatch.setenv("LAMIN_USER_HANDLE", "testuser-from-env")
+    assert load_user_settings(user_settings_file).handle == "testuser-from-env"
+    monkeypatch.delenv("LAMIN_USER_HANDLE")
+    assert load_user_settings(user_settings_file).handle == "testuser"